@@ -7,16 +7,23 @@ Adjust these values based on your specific form requirements and system performa
 """
 
 import os
+import functools
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
 
-@dataclass
+# Allowed values for validated string settings
+_NAV_METHODS = frozenset({'tab', 'enter', 'click'})
+_SUB_METHODS = frozenset({'enter', 'tab_enter', 'click'})
+_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR'})
+
+
+@dataclass(slots=True, frozen=True)
 class FormFillerConfig:
     """Configuration class for Form Filler settings."""
     
     # Timing settings (in seconds)
-    pause_between_actions: float = 0.5  # General pause between PyAutoGUI actions
+    pause_between_actions: float = 0.5  # Pause after clicking or typing into a field
     typing_interval: float = 0.05        # Interval between each character typed
     field_transition_delay: float = 0.3  # Delay when moving between fields
     form_submission_delay: float = 2.0   # Delay after submitting form
@@ -27,6 +34,7 @@ class FormFillerConfig:
     wait_for_page_load: bool = True      # Whether to wait for page load after submission
     clear_fields: bool = True            # Whether to clear fields before typing
     use_failsafe: bool = True            # Enable PyAutoGUI failsafe (move mouse to corner)
+    batch_input: bool = False            # Type each record with one xdotool call (Linux, tab navigation)
     
     # Form navigation settings
     navigation_method: str = 'tab'       # Method to move between fields ('tab', 'enter', 'click')
@@ -35,6 +43,7 @@ class FormFillerConfig:
     # Data handling settings
     skip_empty_fields: bool = True       # Skip fields with empty/NaN values
     max_field_length: Optional[int] = None  # Maximum characters per field (None for unlimited)
+    paste_threshold: Optional[int] = None  # Paste text longer than this via clipboard (None to always type)
     encoding: str = 'utf-8'              # File encoding for CSV files
     
     # Safety settings
@@ -49,37 +58,48 @@ class FormFillerConfig:
     screen_resolution: Optional[Tuple[int, int]] = None  # Expected screen resolution
     
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> 'FormFillerConfig':
         """
         Create configuration from environment variables.
         
+        The environment is read once and the resulting (immutable) instance is
+        reused; call ``FormFillerConfig.from_env.cache_clear()`` to re-read it.
+        
         Returns:
             FormFillerConfig instance with values from environment
         """
+        env = os.environ
+        max_field_length = env.get('FF_MAX_FIELD_LENGTH')
+        max_records_per_session = env.get('FF_MAX_RECORDS_PER_SESSION')
+        paste_threshold = env.get('FF_PASTE_THRESHOLD')
+        
         return cls(
-            pause_between_actions=float(os.getenv('FF_PAUSE_BETWEEN_ACTIONS', '0.5')),
-            typing_interval=float(os.getenv('FF_TYPING_INTERVAL', '0.05')),
-            field_transition_delay=float(os.getenv('FF_FIELD_TRANSITION_DELAY', '0.3')),
-            form_submission_delay=float(os.getenv('FF_FORM_SUBMISSION_DELAY', '2.0')),
-            record_delay=float(os.getenv('FF_RECORD_DELAY', '1.0')),
-            page_load_delay=float(os.getenv('FF_PAGE_LOAD_DELAY', '3.0')),
+            pause_between_actions=float(env.get('FF_PAUSE_BETWEEN_ACTIONS', '0.5')),
+            typing_interval=float(env.get('FF_TYPING_INTERVAL', '0.05')),
+            field_transition_delay=float(env.get('FF_FIELD_TRANSITION_DELAY', '0.3')),
+            form_submission_delay=float(env.get('FF_FORM_SUBMISSION_DELAY', '2.0')),
+            record_delay=float(env.get('FF_RECORD_DELAY', '1.0')),
+            page_load_delay=float(env.get('FF_PAGE_LOAD_DELAY', '3.0')),
             
-            wait_for_page_load=os.getenv('FF_WAIT_FOR_PAGE_LOAD', 'True').lower() == 'true',
-            clear_fields=os.getenv('FF_CLEAR_FIELDS', 'True').lower() == 'true',
-            use_failsafe=os.getenv('FF_USE_FAILSAFE', 'True').lower() == 'true',
+            wait_for_page_load=env.get('FF_WAIT_FOR_PAGE_LOAD', 'True').lower() == 'true',
+            clear_fields=env.get('FF_CLEAR_FIELDS', 'True').lower() == 'true',
+            use_failsafe=env.get('FF_USE_FAILSAFE', 'True').lower() == 'true',
+            batch_input=env.get('FF_BATCH_INPUT', 'False').lower() == 'true',
             
-            navigation_method=os.getenv('FF_NAVIGATION_METHOD', 'tab'),
-            submission_method=os.getenv('FF_SUBMISSION_METHOD', 'enter'),
+            navigation_method=env.get('FF_NAVIGATION_METHOD', 'tab'),
+            submission_method=env.get('FF_SUBMISSION_METHOD', 'enter'),
             
-            skip_empty_fields=os.getenv('FF_SKIP_EMPTY_FIELDS', 'True').lower() == 'true',
-            max_field_length=int(os.getenv('FF_MAX_FIELD_LENGTH')) if os.getenv('FF_MAX_FIELD_LENGTH') else None,
-            encoding=os.getenv('FF_ENCODING', 'utf-8'),
+            skip_empty_fields=env.get('FF_SKIP_EMPTY_FIELDS', 'True').lower() == 'true',
+            max_field_length=int(max_field_length) if max_field_length else None,
+            paste_threshold=int(paste_threshold) if paste_threshold else None,
+            encoding=env.get('FF_ENCODING', 'utf-8'),
             
-            max_records_per_session=int(os.getenv('FF_MAX_RECORDS_PER_SESSION')) if os.getenv('FF_MAX_RECORDS_PER_SESSION') else None,
-            confirmation_required=os.getenv('FF_CONFIRMATION_REQUIRED', 'True').lower() == 'true',
+            max_records_per_session=int(max_records_per_session) if max_records_per_session else None,
+            confirmation_required=env.get('FF_CONFIRMATION_REQUIRED', 'True').lower() == 'true',
             
-            log_level=os.getenv('FF_LOG_LEVEL', 'INFO'),
-            log_file=os.getenv('FF_LOG_FILE'),
+            log_level=env.get('FF_LOG_LEVEL', 'INFO'),
+            log_file=env.get('FF_LOG_FILE'),
         )
     
     def validate(self) -> None:
@@ -95,79 +115,91 @@ class FormFillerConfig:
         if self.typing_interval < 0:
             raise ValueError("typing_interval must be non-negative")
         
-        if self.navigation_method not in ['tab', 'enter', 'click']:
+        if self.navigation_method not in _NAV_METHODS:
             raise ValueError("navigation_method must be 'tab', 'enter', or 'click'")
         
-        if self.submission_method not in ['enter', 'tab_enter', 'click']:
+        if self.submission_method not in _SUB_METHODS:
             raise ValueError("submission_method must be 'enter', 'tab_enter', or 'click'")
         
-        if self.log_level not in ['DEBUG', 'INFO', 'WARNING', 'ERROR']:
+        if self.log_level not in _LOG_LEVELS:
             raise ValueError("log_level must be 'DEBUG', 'INFO', 'WARNING', or 'ERROR'")
         
         if self.max_field_length is not None and self.max_field_length <= 0:
             raise ValueError("max_field_length must be positive or None")
         
+        if self.paste_threshold is not None and self.paste_threshold < 0:
+            raise ValueError("paste_threshold must be non-negative or None")
+        
         if self.max_records_per_session is not None and self.max_records_per_session <= 0:
             raise ValueError("max_records_per_session must be positive or None")
 
 
-# Predefined configurations for common scenarios
+# Predefined configurations for common scenarios (frozen, so shared safely)
+_FAST_FILLING = FormFillerConfig(
+    pause_between_actions=0.1,
+    typing_interval=0.01,
+    field_transition_delay=0.1,
+    form_submission_delay=1.0,
+    record_delay=0.5,
+    page_load_delay=1.5,
+)
+
+_SLOW_RELIABLE = FormFillerConfig(
+    pause_between_actions=1.0,
+    typing_interval=0.1,
+    field_transition_delay=0.5,
+    form_submission_delay=3.0,
+    record_delay=2.0,
+    page_load_delay=5.0,
+)
+
+_WEB_FORMS = FormFillerConfig(
+    pause_between_actions=0.5,
+    typing_interval=0.05,
+    field_transition_delay=0.3,
+    form_submission_delay=2.0,
+    record_delay=1.5,
+    page_load_delay=4.0,
+    navigation_method='tab',
+    submission_method='enter',
+    wait_for_page_load=True,
+)
+
+_DESKTOP_APPS = FormFillerConfig(
+    pause_between_actions=0.3,
+    typing_interval=0.03,
+    field_transition_delay=0.2,
+    form_submission_delay=1.0,
+    record_delay=0.5,
+    page_load_delay=1.0,
+    navigation_method='tab',
+    submission_method='enter',
+    wait_for_page_load=False,
+)
+
+
 class CommonConfigs:
     """Predefined configurations for common use cases."""
     
     @staticmethod
     def fast_filling() -> FormFillerConfig:
         """Configuration for fast form filling (minimal delays)."""
-        return FormFillerConfig(
-            pause_between_actions=0.1,
-            typing_interval=0.01,
-            field_transition_delay=0.1,
-            form_submission_delay=1.0,
-            record_delay=0.5,
-            page_load_delay=1.5,
-        )
+        return _FAST_FILLING
     
     @staticmethod
     def slow_reliable() -> FormFillerConfig:
         """Configuration for slow but reliable form filling."""
-        return FormFillerConfig(
-            pause_between_actions=1.0,
-            typing_interval=0.1,
-            field_transition_delay=0.5,
-            form_submission_delay=3.0,
-            record_delay=2.0,
-            page_load_delay=5.0,
-        )
+        return _SLOW_RELIABLE
     
     @staticmethod
     def web_forms() -> FormFillerConfig:
         """Configuration optimized for web forms."""
-        return FormFillerConfig(
-            pause_between_actions=0.5,
-            typing_interval=0.05,
-            field_transition_delay=0.3,
-            form_submission_delay=2.0,
-            record_delay=1.5,
-            page_load_delay=4.0,
-            navigation_method='tab',
-            submission_method='enter',
-            wait_for_page_load=True,
-        )
+        return _WEB_FORMS
     
     @staticmethod
     def desktop_apps() -> FormFillerConfig:
         """Configuration optimized for desktop applications."""
-        return FormFillerConfig(
-            pause_between_actions=0.3,
-            typing_interval=0.03,
-            field_transition_delay=0.2,
-            form_submission_delay=1.0,
-            record_delay=0.5,
-            page_load_delay=1.0,
-            navigation_method='tab',
-            submission_method='enter',
-            wait_for_page_load=False,
-        )
+        return _DESKTOP_APPS
 
 
 # Default configuration instance
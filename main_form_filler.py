@@ -9,17 +9,70 @@ Author: Your Name
 License: MIT
 """
 
+from __future__ import annotations
+
 import csv
 import time
 import sys
+import shutil
 import logging
+import functools
+import subprocess
+import importlib.util
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, List, Dict, Optional, Sequence, Tuple
 
-import pyautogui
-import pandas as pd
 from config import FormFillerConfig
 
+# pandas, pyautogui, pyperclip and pyarrow are imported where they are used
+# to keep startup fast
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _setup_logging(log_level: str = 'INFO', log_file: Optional[str] = None) -> logging.Logger:
+    """
+    Return the module logger with its level set to log_level.
+    
+    The handler (console, or log_file if given) is attached only once, by
+    the first FormFiller created; later calls just update the level.
+    """
+    logger = logging.getLogger(__name__)
+    logger.setLevel(log_level.upper())  # FF_LOG_LEVEL is passed through as given
+    
+    if not logger.handlers:
+        handler = logging.FileHandler(log_file) if log_file else logging.StreamHandler()
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    
+    return logger
+
+
+def _dedupe_column_names(names: List[str]) -> List[str]:
+    """Rename repeated CSV headers to 'name.1', 'name.2', ... like pandas."""
+    seen = set()
+    counts: Dict[str, int] = {}
+    result = []
+    for name in names:
+        new_name = name
+        while new_name in seen:
+            counts[name] = counts.get(name, 0) + 1
+            new_name = f"{name}.{counts[name]}"
+        seen.add(new_name)
+        result.append(new_name)
+    return result
+
+
+@functools.lru_cache(maxsize=1)
+def _get_screen_size() -> Tuple[int, int]:
+    """Return the screen size, which does not change during a session."""
+    import pyautogui
+    width, height = pyautogui.size()
+    return width, height
+
 
 class FormFiller:
     """Main class for automatic form filling functionality."""
@@ -32,28 +85,22 @@ class FormFiller:
             config: FormFillerConfig object containing all settings
         """
         self.config = config
-        self.logger = self._setup_logging()
+        self.logger = _setup_logging(self.config.log_level, self.config.log_file)
         
         # Configure PyAutoGUI
+        import pyautogui
+        self._pg = pyautogui
         pyautogui.FAILSAFE = True  # Move mouse to top-left corner to abort
-        pyautogui.PAUSE = self.config.pause_between_actions
-        
-        self.logger.info("FormFiller initialized successfully")
-    
-    def _setup_logging(self) -> logging.Logger:
-        """Set up logging configuration."""
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
+        # Pacing is handled explicitly by each action so delays are not paid twice
+        pyautogui.PAUSE = 0
         
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        # Batched input needs xdotool; fall back to per-field typing without it
+        self.batch_input = self.config.batch_input
+        if self.batch_input and shutil.which('xdotool') is None:
+            self.logger.warning("xdotool not found - falling back to per-field typing")
+            self.batch_input = False
         
-        return logger
+        self.logger.info("FormFiller initialized successfully")
     
     def load_data(self, file_path: str) -> pd.DataFrame:
         """
@@ -69,8 +116,15 @@ class FormFiller:
             FileNotFoundError: If the file doesn't exist
             pd.errors.EmptyDataError: If the file is empty
         """
+        import pandas as pd
+        
         try:
-            data = pd.read_csv(file_path)
+            if importlib.util.find_spec('pyarrow') is not None:
+                data = self._read_csv_arrow(file_path)
+            else:
+                # Read as text, like the PyArrow path, so values such as zip
+                # codes keep their leading zeros and are not turned into floats
+                data = pd.read_csv(file_path, dtype=str)
             self.logger.info(f"Loaded {len(data)} records from {file_path}")
             return data
         except FileNotFoundError:
@@ -80,6 +134,48 @@ class FormFiller:
             self.logger.error(f"Empty file: {file_path}")
             raise
     
+    def _read_csv_arrow(self, file_path: str) -> pd.DataFrame:
+        """
+        Parse a CSV file with PyArrow's multithreaded reader.
+        
+        Every column is read as text, so values are typed exactly as they
+        appear in the file (no date or number reformatting). Empty cells
+        become NaN and duplicate headers are renamed 'name.1', 'name.2', ...
+        as pd.read_csv does. Quoted values may span lines. Files PyArrow
+        rejects are read with pd.read_csv instead.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Returns:
+            DataFrame containing the form data
+        """
+        import pandas as pd
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+        
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            header = next(csv.reader(f), None)
+        if not header:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+        
+        column_names = _dedupe_column_names(header)
+        try:
+            table = pa_csv.read_csv(
+                file_path,
+                read_options=pa_csv.ReadOptions(column_names=column_names, skip_rows=1),
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in column_names},
+                    strings_can_be_null=True,
+                ),
+            )
+        except pa.ArrowInvalid as e:
+            # e.g. rows shorter than the header, which pandas pads with NaN
+            self.logger.warning(f"PyArrow could not parse {file_path}, using pandas: {e}")
+            return pd.read_csv(file_path, dtype=str)
+        return table.to_pandas()
+    
     def wait_for_user_setup(self, countdown: int = 5) -> None:
         """
         Give user time to position windows and prepare for automation.
@@ -90,12 +186,15 @@ class FormFiller:
         print(f"\nPrepare your form and click on the first field.")
         print("Form filling will start in:")
         
+        write = sys.stdout.write
+        flush = sys.stdout.flush
         for i in range(countdown, 0, -1):
-            print(f"{i}...")
+            write(f"{i}... ")
+            flush()
             time.sleep(1)
         
-        print("Starting form filling! Move mouse to top-left corner to abort.")
-        time.sleep(1)
+        write("\nStarting form filling! Move mouse to top-left corner to abort.\n")
+        flush()
     
     def click_field(self, field_position: Optional[Tuple[int, int]] = None) -> bool:
         """
@@ -109,11 +208,12 @@ class FormFiller:
         """
         try:
             if field_position:
-                pyautogui.click(field_position[0], field_position[1])
+                self._pg.click(field_position[0], field_position[1])
             else:
-                pyautogui.click()
+                self._pg.click()
+            time.sleep(self.config.pause_between_actions)
             return True
-        except pyautogui.FailSafeException:
+        except self._pg.FailSafeException:
             self.logger.warning("FailSafe triggered - stopping automation")
             return False
         except Exception as e:
@@ -133,18 +233,53 @@ class FormFiller:
         """
         try:
             if clear_field:
-                pyautogui.hotkey('ctrl', 'a')  # Select all
+                self._pg.hotkey('ctrl', 'a')  # Select all
                 time.sleep(0.1)
             
-            pyautogui.write(str(text), interval=self.config.typing_interval)
+            text = str(text)
+            paste_threshold = self.config.paste_threshold
+            # Long values are pasted in one go instead of typed per character
+            pasted = (paste_threshold is not None and len(text) > paste_threshold
+                      and self._paste_text(text))
+            if not pasted:
+                self._pg.write(text, interval=self.config.typing_interval)
+            time.sleep(self.config.pause_between_actions)
             return True
-        except pyautogui.FailSafeException:
+        except self._pg.FailSafeException:
             self.logger.warning("FailSafe triggered - stopping automation")
             return False
         except Exception as e:
             self.logger.error(f"Error typing text: {e}")
             return False
     
+    def _paste_text(self, text: str) -> bool:
+        """
+        Paste text through the clipboard, restoring its previous contents.
+        
+        Args:
+            text: Text to paste
+            
+        Returns:
+            True if the text was pasted, False if the clipboard is unavailable
+        """
+        try:
+            import pyperclip
+            previous = pyperclip.paste()
+            pyperclip.copy(text)
+        except Exception as e:
+            self.logger.warning(f"Clipboard unavailable, typing instead: {e}")
+            return False
+        
+        try:
+            self._pg.hotkey('ctrl', 'v')
+            time.sleep(0.1)  # Let the target read the clipboard before restoring it
+        finally:
+            try:
+                pyperclip.copy(previous)
+            except Exception as e:
+                self.logger.warning(f"Could not restore clipboard contents: {e}")
+        return True
+    
     def move_to_next_field(self, method: str = 'tab') -> bool:
         """
         Move to the next form field.
@@ -157,9 +292,9 @@ class FormFiller:
         """
         try:
             if method == 'tab':
-                pyautogui.press('tab')
+                self._pg.press('tab')
             elif method == 'enter':
-                pyautogui.press('enter')
+                self._pg.press('enter')
             elif method == 'click':
                 # This would require predefined coordinates
                 pass
@@ -169,7 +304,7 @@ class FormFiller:
             
             time.sleep(self.config.field_transition_delay)
             return True
-        except pyautogui.FailSafeException:
+        except self._pg.FailSafeException:
             self.logger.warning("FailSafe triggered - stopping automation")
             return False
         except Exception as e:
@@ -188,49 +323,84 @@ class FormFiller:
         """
         try:
             if method == 'enter':
-                pyautogui.press('enter')
+                self._pg.press('enter')
             elif method == 'tab_enter':
-                pyautogui.press('tab')
+                self._pg.press('tab')
                 time.sleep(0.5)
-                pyautogui.press('enter')
+                self._pg.press('enter')
             elif method == 'click':
                 # Would require submit button coordinates
                 pass
             
             time.sleep(self.config.form_submission_delay)
             return True
-        except pyautogui.FailSafeException:
+        except self._pg.FailSafeException:
             self.logger.warning("FailSafe triggered - stopping automation")
             return False
         except Exception as e:
             self.logger.error(f"Error submitting form: {e}")
             return False
     
-    def fill_single_record(self, record: Dict[str, str], field_order: List[str]) -> bool:
+    def _type_record_batched(self, values: List[str]) -> bool:
+        """
+        Type a whole record with a single xdotool call.
+        
+        Fields are separated by tab characters, so this is only used with
+        tab navigation. Fields are not cleared first and the PyAutoGUI
+        failsafe is not checked while xdotool is typing.
+        
+        Args:
+            values: Field texts in form order, each followed by a tab
+            
+        Returns:
+            True if typing was successful, False otherwise
+        """
+        delay_ms = int(self.config.typing_interval * 1000)
+        try:
+            subprocess.run(
+                ['xdotool', 'type', '--delay', str(delay_ms), '--', ''.join(values)],
+                check=True,
+            )
+            return True
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.logger.error(f"Error typing record with xdotool: {e}")
+            return False
+    
+    def fill_single_record(self, row_values: Sequence[object],
+                           present_mask: Sequence[bool]) -> bool:
         """
         Fill a single record into the form.
         
         Args:
-            record: Dictionary containing field values
-            field_order: List of field names in the order they appear in the form
+            row_values: Field values as strings in form order, with empty cells as None
+            present_mask: Whether each field in form order exists in the data
             
         Returns:
             True if successful, False otherwise
         """
+        if self.batch_input and self.config.navigation_method == 'tab':
+            values = []
+            for value, present in zip(row_values, present_mask):
+                if not present:
+                    values.append('\t')
+                elif value is not None:
+                    values.append(f"{value}\t")
+            return self._type_record_batched(values)
+        
+        type_text = self.type_text
+        next_field = self.move_to_next_field
         try:
-            for field_name in field_order:
-                if field_name in record:
-                    value = record[field_name]
-                    if pd.notna(value):  # Skip NaN values
-                        if not self.type_text(value):
+            for value, present in zip(row_values, present_mask):
+                if present:
+                    if value is not None:  # Skip empty values
+                        if not type_text(value):
                             return False
                         
-                        if not self.move_to_next_field():
+                        if not next_field():
                             return False
                 else:
-                    self.logger.warning(f"Field '{field_name}' not found in record")
-                    # Still move to next field
-                    if not self.move_to_next_field():
+                    # Missing fields are reported once by fill_forms; still move to next field
+                    if not next_field():
                         return False
             
             return True
@@ -238,63 +408,89 @@ class FormFiller:
             self.logger.error(f"Error filling record: {e}")
             return False
     
-    def fill_forms(self, data: pd.DataFrame, field_order: List[str], 
+    def fill_forms(self, data: pd.DataFrame, field_order: Sequence[str], 
                    start_row: int = 0, max_records: Optional[int] = None) -> None:
         """
         Fill multiple forms with data from DataFrame.
         
         Args:
             data: DataFrame containing form data
-            field_order: List of field names in order
+            field_order: Field names in the order they appear in the form
             start_row: Row to start from (for resuming)
             max_records: Maximum number of records to process
         """
+        field_order = tuple(field_order)
+        log = self.logger
+        log_info = log.info
+        log_error = log.error
+        
         try:
+            total = len(data)
             if max_records:
-                end_row = min(start_row + max_records, len(data))
+                end_row = min(start_row + max_records, total)
             else:
-                end_row = len(data)
+                end_row = total
             
-            self.logger.info(f"Processing records {start_row} to {end_row-1}")
+            log_info("Processing records %d to %d", start_row, end_row - 1)
             
-            for index in range(start_row, end_row):
-                record = data.iloc[index].to_dict()
-                
-                self.logger.info(f"Processing record {index + 1}/{len(data)}")
+            # Bind loop invariants locally to avoid repeated attribute lookups
+            record_delay = self.config.record_delay
+            wait_page = self.config.wait_for_page_load
+            page_load_delay = self.config.page_load_delay
+            fill = self.fill_single_record
+            submit = self.submit_form
+            
+            # Resolve column positions once; -1 marks a field missing from the data
+            positions = data.columns.get_indexer(field_order)
+            present_mask = tuple((positions >= 0).tolist())
+            missing = [field for field, present in zip(field_order, present_mask) if not present]
+            if missing:
+                log.warning("Fields not found in data: %s", ', '.join(missing))
+            
+            # Cast to str and map NaN to None in one vectorized pass, laid out in
+            # form order, and unpack into plain lists so the per-field loop never
+            # touches numpy. The object cast must precede where(): on a string
+            # dtype, where(..., None) would leave NaN in the gaps.
+            subset = data.iloc[start_row:end_row].reindex(columns=field_order)
+            text = subset.astype(str).astype(object)
+            rows = text.where(subset.notna(), None).to_numpy().tolist()
+            
+            for index, row_values in enumerate(rows, start=start_row):
+                log_info("Processing record %d/%d", index + 1, total)
                 
                 # Fill the form
-                if not self.fill_single_record(record, field_order):
-                    self.logger.error(f"Failed to fill record {index + 1}")
+                if not fill(row_values, present_mask):
+                    log_error("Failed to fill record %d", index + 1)
                     break
                 
                 # Submit the form
-                if not self.submit_form():
-                    self.logger.error(f"Failed to submit record {index + 1}")
+                if not submit():
+                    log_error("Failed to submit record %d", index + 1)
                     break
                 
                 # Wait before next record
-                time.sleep(self.config.record_delay)
+                time.sleep(record_delay)
                 
                 # Optional: Wait for page to load/refresh
-                if self.config.wait_for_page_load:
-                    time.sleep(self.config.page_load_delay)
+                if wait_page:
+                    time.sleep(page_load_delay)
                 
-                self.logger.info(f"Successfully processed record {index + 1}")
+                log_info("Successfully processed record %d", index + 1)
             
-            self.logger.info("Form filling completed!")
+            log_info("Form filling completed!")
             
         except KeyboardInterrupt:
-            self.logger.info(f"Process interrupted by user at record {index + 1}")
+            log_info("Process interrupted by user at record %d", index + 1)
             print(f"\nStopped at record {index + 1}. You can resume from this point.")
-        except pyautogui.FailSafeException:
-            self.logger.info("FailSafe activated - automation stopped")
+        except self._pg.FailSafeException:
+            log_info("FailSafe activated - automation stopped")
         except Exception as e:
-            self.logger.error(f"Unexpected error: {e}")
+            log_error("Unexpected error: %s", e)
     
     def get_screen_info(self) -> Dict[str, int]:
         """Get screen dimensions and current mouse position."""
-        screen_width, screen_height = pyautogui.size()
-        mouse_x, mouse_y = pyautogui.position()
+        screen_width, screen_height = _get_screen_size()
+        mouse_x, mouse_y = self._pg.position()
         
         return {
             'screen_width': screen_width,
@@ -316,7 +512,7 @@ def main():
         data = filler.load_data(data_file)
         
         # Define field order (should match your form)
-        field_order = ['name', 'email', 'phone', 'address', 'city', 'zipcode']
+        field_order = ('name', 'email', 'phone', 'address', 'city', 'zipcode')
         
         # Show screen info
         screen_info = filler.get_screen_info()